@@ -66,6 +66,31 @@ Useful references:
 
 Math = integer_math.IntegerMath
 
+"""
+Below these many coefficients, Poly.multiply_dense_coefficients just
+uses the schoolbook method, since the fancier methods have overhead
+that doesn't pay for itself on short lists.  (We picked these by
+measuring; they aren't magic.)
+"""
+KARATSUBA_CUTOFF = 32
+KRONECKER_CUTOFF = 8
+
+"""
+Likewise, Poly.dense_eval only switches from Horner's scheme to
+Estrin's scheme for polynomials with at least this many coefficients.
+Estrin only wins once the intermediate integers get big, so the real
+crossover depends on x, but this is about where it is for modest x.
+"""
+ESTRIN_CUTOFF = 384
+
+"""
+After this many calls to Poly.eval that walk the Horner tree, we
+compile the polynomial (see Poly.compile) and use that from then on.
+Compiling costs roughly as much as 30-40 tree walks, so this bounds
+the overhead for polys that only get evaluated a few times.
+"""
+COMPILE_THRESHOLD = 32
+
 
 def set_math(handler):
     """
@@ -101,15 +126,23 @@ def enforce_list_element_types(lst, _type):
 def enforce_sorted_distinct_list(lst):
     enforce_type(lst, list)
 
-    if lst != sorted(lst):
-        raise ValueError(f"{lst} is not sorted")
-
-    if len(lst) != len(set(lst)):
+    # In a sorted list any duplicates are neighbors, so one pass over
+    # adjacent pairs checks both conditions without copying the list.
+    has_duplicates = False
+    for i in range(1, len(lst)):
+        a = lst[i - 1]
+        b = lst[i]
+        if a > b:
+            raise ValueError(f"{lst} is not sorted")
+        if a == b:
+            has_duplicates = True
+
+    if has_duplicates:
         raise ValueError(f"{lst} has duplicate items")
 
 
 def enforce_type(var, _type):
-    if type(var) != _type:
+    if type(var) is not _type:
         raise TypeError(f"{var} is not type {_type}")
 
 
@@ -123,8 +156,17 @@ class _VarPower:
 
     You never want to use this class directly; go through Poly
     instead.
+
+    Since VarPower objects are immutable, we usually share a single
+    instance for each (var_name, exponent) pair.  See _VarPower.get.
+    We construct a lot of these when multiplying polynomials, so this
+    saves memory, and it means we only validate each pair once.
     """
 
+    __slots__ = ("var_name", "exponent", "sig")
+
+    cache = {}
+
     def __init__(self, var_name, exponent):
         enforce_type(var_name, str)
         enforce_legal_variable_name(var_name)
@@ -146,10 +188,26 @@ class _VarPower:
         return Math.power(x, self.exponent)
 
     def signature(self):
-        if self.exponent == Math.one:
+        if self.exponent == 1:
             return self.var_name
         return f"({self.var_name}**{self.exponent})"
 
+    @staticmethod
+    def get(var_name, exponent):
+        """
+        Return the shared VarPower for (var_name, exponent), creating
+        (and validating) it the first time we see that pair.
+
+        The cache only grows with the number of distinct variable
+        powers that we ever use, which stays small in practice.
+        """
+        key = (var_name, exponent)
+        var_power = _VarPower.cache.get(key)
+        if var_power is None:
+            var_power = _VarPower(var_name, exponent)
+            _VarPower.cache[key] = var_power
+        return var_power
+
 
 class _Term:
     """
@@ -164,25 +222,61 @@ class _Term:
     Our basic data structure simply stores a coefficient
     (abbreviated as "coeff") and a list of VarPowers.
 
-    We also keep a dictionary keyed on var names for quick lookups,
-    as well as a "sig" that represents the signature of our term.
+    We also keep a dictionary keyed on var names for quick lookups
+    (built lazily, since many terms never need it), as well as a
+    "sig" that represents the signature of our term.
     Two terms can only be combined if they have the same sig.
+
+    The sig is a tuple of the sigs of our VarPowers, such as
+    ("(x**3)", "(y**3)").  It is only used for hashing and comparisons,
+    so we don't bother to join it into a single string.  (The VarPower
+    sigs are computed once, and Python caches their hashes, so this is
+    also cheaper to hash than a tuple of (var_name, exponent) pairs.)
+
+    Our own methods pass in validate=False when they build terms
+    out of parts that are already known to be valid (e.g. the
+    var_powers of an existing term).  And if only the coefficient
+    changes, see _Term.with_coeff.
+
+    We create lots of terms, so we use __slots__ to keep them small.
     """
 
-    def __init__(self, coeff, var_powers):
-        enforce_type(coeff, Math.value_type)
+    __slots__ = (
+        "coeff",
+        "var_powers",
+        "sig",
+        "var_dict_cache",
+        "var_powers_str",
+    )
+
+    constants = {}
+
+    def __init__(self, coeff, var_powers, validate=True):
+        if validate:
+            enforce_type(coeff, Math.value_type)
 
-        enforce_list_element_types(var_powers, _VarPower)
+            enforce_list_element_types(var_powers, _VarPower)
 
-        var_names = [vp.var_name for vp in var_powers]
-        enforce_sorted_distinct_list(var_names)
+            var_names = [vp.var_name for vp in var_powers]
+            enforce_sorted_distinct_list(var_names)
 
         self.var_powers = var_powers
         self.coeff = coeff
 
-        self.sig = "*".join(vp.sig for vp in var_powers)
-        self.var_dict = {vp.var_name: vp.exponent for vp in var_powers}
-        self.var_names = set(self.var_dict.keys())
+        self.sig = tuple(vp.sig for vp in var_powers)
+        self.var_dict_cache = None
+        self.var_powers_str = None
+
+    @property
+    def var_dict(self):
+        """
+        This maps our var names to their exponents.  Most terms (for
+        example, the partial products in Poly.multiply_polys) never
+        need it, so we build it lazily.
+        """
+        if self.var_dict_cache is None:
+            self.var_dict_cache = {vp.var_name: vp.exponent for vp in self.var_powers}
+        return self.var_dict_cache
 
     def apply(self, **var_assignments):
         """
@@ -199,7 +293,7 @@ class _Term:
             enforce_type(var, str)
             enforce_type(value, Math.value_type)
 
-        if not set(var_assignments) & set(self.var_dict):
+        if not any(vp.var_name in var_assignments for vp in self.var_powers):
             return self
 
         new_coeff = self.coeff
@@ -210,19 +304,25 @@ class _Term:
                 new_coeff = Math.mul(new_coeff, vp.compute_power(value))
             else:
                 new_vps.append(vp)
-        return _Term(new_coeff, new_vps)
+        return _Term(new_coeff, new_vps, validate=False)
 
     def canonicalized_string(self):
         """
         An example string is "60*x*(y**22)".
+
+        We build the "x*(y**22)" part the first time that somebody
+        asks for it, and then we remember it.  (Terms that only differ
+        by their coefficients share it; see with_coeff.)
         """
         coeff_str = self.coeff_str()
 
         if self.is_constant():
             return coeff_str
+        if self.var_powers_str is None:
+            self.var_powers_str = "*".join(vp.sig for vp in self.var_powers)
         if self.coeff == Math.one:
-            return self.sig
-        return coeff_str + "*" + self.sig
+            return self.var_powers_str
+        return coeff_str + "*" + self.var_powers_str
 
     def coeff_str(self):
         """
@@ -238,29 +338,6 @@ class _Term:
         enforce_type(var_name, str)
         return self.var_dict.get(var_name, 0)
 
-    def eval(self, **var_assignments):
-        """
-        This function returns the actual numerical value of
-        our term given values for all its variables.
-
-        If we get passed in vars that we don't know about,
-        just ignore them. (That relieves Poly from having
-        to check each of its terms to see which variables
-        are used.)
-        """
-        for var, value in var_assignments.items():
-            enforce_type(var, str)
-            enforce_type(value, Math.value_type)
-
-        for var_name in self.var_names:
-            if var_name not in var_assignments:
-                raise ValueError(f"You are not providing an assignment for {var_name}.")
-
-        product = Math.one
-        for vp in self.var_powers:
-            product = Math.mul(product, vp.compute_power(var_assignments[vp.var_name]))
-        return Math.mul(self.coeff, product)
-
     def factorize_on_var(self, substituted_var):
         """
         This method is used by Poly when you are trying to substitute
@@ -273,7 +350,8 @@ class _Term:
 
         var_powers = [vp for vp in self.var_powers if vp.var_name != substituted_var]
         power_of_substituted_var = self.var_dict[substituted_var]
-        return (_Term(self.coeff, var_powers), power_of_substituted_var)
+        smaller_term = _Term(self.coeff, var_powers, validate=False)
+        return (smaller_term, power_of_substituted_var)
 
     def is_constant(self):
         """
@@ -290,7 +368,7 @@ class _Term:
             return _Term.zero()
         if c == Math.one:
             return self
-        return _Term(Math.mul(c, self.coeff), self.var_powers)
+        return self.with_coeff(Math.mul(c, self.coeff))
 
     def multiply_with(self, other):
         """
@@ -308,7 +386,16 @@ class _Term:
         raise TypeError("We don't support this type of multiplication.")
 
     def negate(self):
-        return _Term(Math.negate(self.coeff), self.var_powers)
+        return self.with_coeff(Math.negate(self.coeff))
+
+    def packed_exponents(self, offsets):
+        """
+        See Poly.exponent_field_offsets.
+        """
+        key = 0
+        for vp in self.var_powers:
+            key += vp.exponent << offsets[vp.var_name]
+        return key
 
     def raised_to_exponent(self, exponent):
         """
@@ -330,29 +417,47 @@ class _Term:
             return self
 
         coeff = Math.power(self.coeff, exponent)
-        vps = [_VarPower(vp.var_name, vp.exponent * exponent) for vp in self.var_powers]
-        return _Term(coeff, vps)
-
-    def sort_key(self, var_names):
-        """
-        This is used by Poly to sort terms in the normal high
-        school algebra format.  The var_names list comes from our
-        parent Poly.  See Poly.put_terms_in_order for more context.
-        """
-        enforce_list_element_types(var_names, str)
-
-        def exponent(var_name):
-            return self.var_dict.get(var_name, 0)
-
-        return tuple(exponent(var_name) for var_name in var_names)
+        vps = [
+            _VarPower.get(vp.var_name, vp.exponent * exponent)
+            for vp in self.var_powers
+        ]
+        return _Term(coeff, vps, validate=False)
 
     def transform_coefficient(self, f):
         assert callable(f)
-        return _Term(f(self.coeff), self.var_powers)
+        coeff = f(self.coeff)
+        enforce_type(coeff, Math.value_type)
+        return self.with_coeff(coeff)
+
+    def with_coeff(self, coeff):
+        """
+        This returns a term with our exact same variables, but a
+        different coefficient.  Since we are immutable, the new term
+        can share our var_powers, as well as the sig and lookup
+        structures that we derived from them, so we don't need to go
+        through __init__.
+        """
+        term = _Term.__new__(_Term)
+        term.coeff = coeff
+        term.var_powers = self.var_powers
+        term.sig = self.sig
+        term.var_dict_cache = self.var_dict_cache
+        term.var_powers_str = self.var_powers_str
+        return term
 
     @staticmethod
     def constant(c):
+        """
+        Terms are immutable, so we share the zero and one terms for
+        each Math handler (see _Term.shared_constants).  We only
+        check identity here, since Math values need not be hashable,
+        and interning every constant would grow without bound.
+        """
         enforce_type(c, Math.value_type)
+        if c is Math.zero:
+            return _Term.zero()
+        if c is Math.one:
+            return _Term.one()
         return _Term(c, [])
 
     @staticmethod
@@ -364,8 +469,17 @@ class _Term:
 
         The coefficient is trivial--just multiply the two coefficients.
 
-        For the VarPower pieces, we use a dict to collect common
-        variables.
+        For the VarPower pieces, we take advantage of the fact that
+        both lists are already sorted by var name, so we can just
+        merge them in a single pass.  Only the common variables
+        need new VarPower objects; we reuse the others, since they
+        are immutable.
+
+        A couple of cases come up a lot and skip the merge: if one
+        side is a constant, we just rescale the other side (keeping
+        its sig and var_dict), and if all the variables of one side
+        sort before all the variables of the other side, we just
+        concatenate the two lists (e.g. x times y**3).
         """
         if term1.coeff == Math.zero or term2.coeff == Math.zero:
             return _Term.zero()
@@ -375,63 +489,184 @@ class _Term:
             return term1
 
         coeff = Math.mul(term1.coeff, term2.coeff)
-        exponents = collections.defaultdict(int)
-        for vp in term1.var_powers:
-            exponents[vp.var_name] = vp.exponent
-        for vp in term2.var_powers:
-            exponents[vp.var_name] += vp.exponent
-        parms = list(exponents.items())
-        parms.sort()
-        vps = [_VarPower(var, exponent) for var, exponent in parms]
-        return _Term(coeff, vps)
+        vps1 = term1.var_powers
+        vps2 = term2.var_powers
+        if len(vps1) == 0:
+            return term2.with_coeff(coeff)
+        if len(vps2) == 0:
+            return term1.with_coeff(coeff)
+        if vps1[-1].var_name < vps2[0].var_name:
+            return _Term(coeff, vps1 + vps2, validate=False)
+        if vps2[-1].var_name < vps1[0].var_name:
+            return _Term(coeff, vps2 + vps1, validate=False)
+
+        vps = []
+        i = 0
+        j = 0
+        while i < len(vps1) and j < len(vps2):
+            vp1 = vps1[i]
+            vp2 = vps2[j]
+            if vp1.var_name < vp2.var_name:
+                vps.append(vp1)
+                i += 1
+            elif vp1.var_name > vp2.var_name:
+                vps.append(vp2)
+                j += 1
+            else:
+                exponent = vp1.exponent + vp2.exponent
+                vps.append(_VarPower.get(vp1.var_name, exponent))
+                i += 1
+                j += 1
+        vps.extend(vps1[i:])
+        vps.extend(vps2[j:])
+        return _Term(coeff, vps, validate=False)
 
     @staticmethod
     def one():
-        return _Term(Math.one, [])
+        return _Term.shared_constants()[1]
 
     @staticmethod
-    def sum(terms):
-        """
-        This is a helper for Poly.
-        Poly will only call us with terms that have the same sig.
-
-        We essentially just add up coefficients.
+    def shared_constants():
+        pair = _Term.constants.get(Math)
+        if pair is None:
+            pair = (_Term(Math.zero, []), _Term(Math.one, []))
+            _Term.constants[Math] = pair
+        return pair
 
-        We also special-case the situation where there is only
-        one term in the sum, since there is no need to create
-        new objects in that case, as _Term objects are immutable.
-        """
-        if len(terms) < 1:
-            raise ValueError("We expect at least one term to be summed.")
-
-        enforce_list_element_types(terms, _Term)
-        term = terms[0]
+    @staticmethod
+    def zero():
+        return _Term.shared_constants()[0]
 
-        if len(terms) == 1:
-            return term
 
-        sig = term.sig
-        coeff = term.coeff
-        for other in terms[1:]:
-            if other.sig != sig:
-                raise AssertionError("We cannot combine unlike terms!!!")
-            coeff = Math.add(coeff, other.coeff)
+class _HornerCompiler:
+    """
+    This helper class builds the Python function for Poly.compile.
+
+    We walk the terms in the same nested Horner form as Poly.eval,
+    but instead of computing values we emit straight-line code,
+    one statement per addition or multiplication, such as:
+
+        def f(**values):
+            v0 = values['x']
+            t0 = constants[0] * v0
+            t1 = t0 + constants[1]
+            ...
+            return t7
+
+    We avoid building one big nested expression, since Python's
+    parser can't handle arbitrarily deep nesting.
+
+    For integers we emit native Python operators.  For other Math
+    handlers, we call Math.add, Math.mul, and Math.power.  Either
+    way, we look up the coefficients in a list rather than writing
+    them into the source, since not every value survives a round
+    trip through repr (and Python refuses to parse huge integers).
+    """
 
-        return _Term(coeff, term.var_powers)
+    def __init__(self, var_names):
+        self.var_names = var_names
+        self.var_index = {var_name: i for i, var_name in enumerate(var_names)}
+        self.native = Math is integer_math.IntegerMath
+        self.constants = []
+        self.lines = []
+        self.powers = {}
+
+    def add(self, a, b):
+        if self.native:
+            return self.assign(f"{a} + {b}")
+        return self.assign(f"add({a}, {b})")
+
+    def assign(self, expr):
+        name = f"t{len(self.lines)}"
+        self.lines.append(f"    {name} = {expr}")
+        return name
+
+    def constant(self, c):
+        self.constants.append(c)
+        return f"constants[{len(self.constants) - 1}]"
+
+    def emit(self, node):
+        """
+        This returns the name (or expression) that holds the value of
+        a node from Poly.build_horner_tree.
+        """
+        if type(node) == _Term:
+            return self.constant(node.coeff)
+
+        var_name, branches = node
+        var_index = self.var_index[var_name]
+        result = None
+        for inner, gap in branches:
+            inner = self.emit(inner)
+            result = inner if result is None else self.add(result, inner)
+            if gap > 0:
+                result = self.mul(result, self.power(var_index, gap))
+        return result
 
-    @staticmethod
-    def zero():
-        return _Term(Math.zero, [])
+    def function(self, poly):
+        if poly.is_zero():
+            result = self.constant(Math.zero)
+        else:
+            result = self.emit(poly.horner_tree())
+
+        lines = ["def f(**values):"]
+        for i, var_name in enumerate(self.var_names):
+            lines.append(f"    v{i} = values[{var_name!r}]")
+        lines.extend(self.lines)
+        lines.append(f"    return {result}")
+
+        namespace = dict(
+            add=Math.add,
+            mul=Math.mul,
+            power=Math.power,
+            constants=self.constants,
+        )
+        exec("\n".join(lines), namespace)
+        return namespace["f"]
+
+    def mul(self, a, b):
+        if self.native:
+            return self.assign(f"{a} * {b}")
+        return self.assign(f"mul({a}, {b})")
+
+    def power(self, var_index, exponent):
+        if exponent == 1:
+            return f"v{var_index}"
+        key = (var_index, exponent)
+        if key not in self.powers:
+            if self.native:
+                self.powers[key] = self.assign(f"v{var_index} ** {exponent}")
+            else:
+                self.powers[key] = self.assign(f"power(v{var_index}, {exponent})")
+        return self.powers[key]
 
 
 class Poly:
-    def __init__(self, terms):
+    __slots__ = (
+        "terms",
+        "var_names",
+        "compiled",
+        "dense",
+        "horner",
+        "powers",
+        "eval_count",
+        "string",
+    )
+
+    def __init__(self, terms, simplified=False, ordered=False):
         if type(terms) == _Term:
             raise ValueError(
                 "Pass in a list of _Terms or use Poly's other constructors."
             )
-        enforce_list_element_types(terms, _Term)
+        if not simplified:
+            enforce_list_element_types(terms, _Term)
         self.terms = terms
+        self.compiled = None
+        self.dense = None
+        self.horner = None
+        self.powers = None
+        self.eval_count = 0
+        self.string = None
 
         """
         Note the invariant here. As SOON as a Poly gets constructed, it
@@ -443,9 +678,27 @@ class Poly:
         subsequent calls to eval() are quicker.  If possible, callers
         should try to reuse existing Poly objects.  For example, if you
         multiple a Poly by one, don't unnecessarily create a new Poly.
+
+        Internal callers that have already combined like terms and
+        removed zero terms can pass in simplified=True to skip the
+        simplify() step, and we also trust them to pass in a list of
+        _Terms.  If the terms are also already in canonical order (e.g.
+        we just negated every term of an existing Poly), they can pass
+        in ordered=True as well to skip the sort.
         """
-        self.simplify()
-        self.put_terms_in_order()
+        if not simplified:
+            self.simplify()
+
+        """
+        Since we never mutate our terms after simplification, we can
+        compute our set of variables once up front.
+        """
+        self.var_names = frozenset(
+            vp.var_name for term in self.terms for vp in term.var_powers
+        )
+
+        if not ordered:
+            self.put_terms_in_order()
 
     def __add__(self, other):
         """
@@ -474,9 +727,21 @@ class Poly:
         if they use the same set of variable names.  While
         x+3 and y+3 are structurally equivalent, we consider them
         to be non-equal.
+
+        We don't actually need to build the strings to compare them.
+        Since our terms are already simplified and put in canonical
+        order, it suffices to compare the sigs and coefficients
+        of the terms in order, and we can stop at the first mismatch.
         """
         enforce_type(other, Poly)
-        return self.canonicalized_string() == other.canonicalized_string()
+        if self is other:
+            return True
+        if len(self.terms) != len(other.terms):
+            return False
+        return all(
+            t1.sig == t2.sig and t1.coeff == t2.coeff
+            for t1, t2 in zip(self.terms, other.terms)
+        )
 
     def __mul__(self, other):
         return self.multiply_with(other)
@@ -560,10 +825,130 @@ class Poly:
         """
         This method is easy, because we do the heavy lifting of calling
         put_terms_in_order when we make a Poly object.
+
+        Since we are immutable, we build the string the first time
+        somebody asks for it and then remember it.
         """
         if len(self.terms) == 0:
             return str(Math.zero)
-        return "+".join(term.canonicalized_string() for term in self.terms)
+        if self.string is None:
+            self.string = "+".join(term.canonicalized_string() for term in self.terms)
+        return self.string
+
+    def compile(self):
+        """
+        If you are going to evaluate the same polynomial many times,
+        you can compile it into a plain Python function first:
+
+            f = (4 * (x**2) - 1).compile()
+            assert f(x=3) == 35
+
+        The function evaluates the same Horner form as eval, but
+        without walking any _Term objects.  Note that it does not
+        validate its inputs the way eval does.
+
+        We cache the function, since Poly objects are immutable.
+        """
+        if self.compiled is None or self.compiled[0] is not Math:
+            compiler = _HornerCompiler(self.horner_var_names())
+            self.compiled = (Math, compiler.function(self))
+        return self.compiled[1]
+
+    def compile_apply(self, *var_names):
+        """
+        This is to apply what compile is to eval.  If you are going to
+        plug values for the same variables into the same polynomial
+        many times, you can get a function that does it:
+
+            f = (x*y + 2*x + 3).compile_apply("x")
+            assert f(x=5) == 5*y + 13
+
+        Up front, we group our terms by the part that doesn't involve
+        var_names (y and 1 above), and compile the rest of each group
+        into a little function of var_names (x and 2*x + 3 above).
+        Then each call just evaluates those functions and scales the
+        leftover parts, without walking our var powers again.
+
+        Like compile, the function does not validate its inputs.  It
+        uses the Math handler that was active when you called us.
+        """
+        my_vars = self.variables()
+        for var_name in var_names:
+            enforce_type(var_name, str)
+            if var_name not in my_vars:
+                raise ValueError(f"{var_name} is not a variable for {self}")
+
+        applied_var_names = set(var_names)
+        groups = collections.defaultdict(list)
+        leftovers = {}
+        for term in self.terms:
+            applied = []
+            rest = []
+            for vp in term.var_powers:
+                if vp.var_name in applied_var_names:
+                    applied.append(vp)
+                else:
+                    rest.append(vp)
+            leftover = _Term(Math.one, rest, validate=False)
+            leftovers.setdefault(leftover.sig, leftover)
+            # Terms with the same leftover must differ in their applied
+            # parts, so each group is already simplified.
+            groups[leftover.sig].append(_Term(term.coeff, applied, validate=False))
+
+        parts = [
+            (leftovers[sig], Poly(terms, simplified=True).compile())
+            for sig, terms in groups.items()
+        ]
+
+        def f(**values):
+            terms = []
+            for leftover, coeff_function in parts:
+                coeff = coeff_function(**values)
+                if coeff != Math.zero:
+                    terms.append(leftover.with_coeff(coeff))
+            return Poly(terms, simplified=True)
+
+        return f
+
+    def dense_coefficients(self, var_name):
+        """
+        For a polynomial in a single variable, such as 3*(x**2)+1,
+        this returns the list of coefficients indexed by degree,
+        such as [1, 0, 3].  Missing degrees get Math.zero.
+
+        Since Poly objects are immutable, we build the list once and
+        cache it (per Math handler, like compile), so please don't
+        modify the list that we return.  The answer can't depend on
+        var_name, since we only have one variable (or none).
+        """
+        enforce_type(var_name, str)
+        if not self.variables() <= {var_name}:
+            raise ValueError(f"{self} is not a polynomial in {var_name} alone")
+
+        if self.dense is None or self.dense[0] is not Math:
+            coeffs = []
+            if not self.is_zero():
+                # put_terms_in_order puts the highest degree first
+                degree = self.terms[0].degree_of_var(var_name)
+                coeffs = [Math.zero] * (degree + 1)
+                for term in self.terms:
+                    coeffs[term.degree_of_var(var_name)] = term.coeff
+            self.dense = (Math, coeffs)
+        return self.dense[1]
+
+    def is_dense(self, var_name):
+        """
+        A polynomial in a single variable is "dense" if at least
+        half of its coefficients (up to its degree) are non-zero.
+
+        For dense polynomials it is cheaper to work with a plain
+        list of coefficients (see dense_coefficients) than with
+        _Term objects, but for something like (x**1000)+1 it is not.
+        """
+        if self.is_zero():
+            return True
+        degree = self.terms[0].degree_of_var(var_name)
+        return degree + 1 <= 2 * len(self.terms)
 
     def is_one(self):
         return len(self.terms) == 1 and self.terms[0].is_one()
@@ -575,6 +960,24 @@ class Poly:
         """
         This method converts a Poly to a Math value (e.g. integer) by
         using the supplied variable assignments.
+
+        Rather than evaluating each term on its own (which would
+        compute x**k from scratch for every term), we use the
+        multivariate version of Horner's scheme.  See Poly.horner_eval
+        and Poly.horner_tree (which we build once and cache).
+
+        For dense polynomials in a single variable, we just run the
+        classic Horner loop (or Estrin's scheme, for long ones) over
+        dense_coefficients.  See Poly.dense_eval.
+
+        If we get evaluated over and over again, we eventually compile
+        ourself (see COMPILE_THRESHOLD) and call the compiled function
+        instead of walking the Horner tree.  That switch should never
+        change the answer, even for coefficients too big to print:
+
+            p = x * y * (10**5000) + 1
+            for i in range(COMPILE_THRESHOLD + 8):
+                assert p.eval(x=i, y=1) == i * 10**5000 + 1
         """
         my_var_names = self.variables()
 
@@ -586,19 +989,98 @@ class Poly:
             if var_name not in var_assignments:
                 raise ValueError(f"The var {var_name} was not supplied.")
 
-        result = Math.zero
+        if len(my_var_names) == 1:
+            (var_name,) = my_var_names
+            if self.is_dense(var_name):
+                coeffs = self.dense_coefficients(var_name)
+                return Poly.dense_eval(coeffs, var_assignments[var_name])
+
+        if self.is_zero():
+            return Math.zero
+
+        self.eval_count += 1
+        if self.eval_count > COMPILE_THRESHOLD:
+            return self.compile()(**var_assignments)
+        return Poly.horner_eval(self.horner_tree(), var_assignments, {})
+
+    def eval_many(self, **var_values):
+        """
+        This is like eval, except that each variable gets a list of
+        values, and we return the list of results:
+
+            assert (x * y + 1).eval_many(x=[1, 2], y=[3, 4]) == [4, 9]
+
+        It is cheaper than calling eval in a loop, because we only
+        validate our inputs once.  For a dense polynomial in a single
+        variable we only compute dense_coefficients once, and for other
+        polynomials we use the function from compile.
+        """
+        my_var_names = self.variables()
+
+        for var_name, values in var_values.items():
+            enforce_type(var_name, str)
+            enforce_list_element_types(values, Math.value_type)
+
+        for var_name in my_var_names:
+            if var_name not in var_values:
+                raise ValueError(f"The var {var_name} was not supplied.")
+
+        lengths = {len(values) for values in var_values.values()}
+        if len(lengths) > 1:
+            raise ValueError("All the lists of values must have the same length.")
+        num_values = lengths.pop() if lengths else 0
+
+        if len(my_var_names) == 1:
+            (var_name,) = my_var_names
+            if self.is_dense(var_name):
+                coeffs = self.dense_coefficients(var_name)
+                return [Poly.dense_eval(coeffs, x) for x in var_values[var_name]]
+
+        f = self.compile()
+        return [
+            f(**{var_name: var_values[var_name][i] for var_name in var_values})
+            for i in range(num_values)
+        ]
+
+    def horner_tree(self):
+        """
+        We build the nested Horner form lazily and cache it, so that
+        repeated calls to eval don't have to regroup our terms.  See
+        Poly.build_horner_tree for the shape of the tree.
+        """
+        if self.horner is None:
+            self.horner = Poly.build_horner_tree(self.terms, self.horner_var_names())
+        return self.horner
+
+    def horner_var_names(self):
+        """
+        This is the order in which Horner evaluation factors out our
+        variables.  The variables that show up in the most terms go
+        first, since that tends to save the most multiplications.
+        """
+        counts = collections.Counter()
         for term in self.terms:
-            result = Math.add(result, term.eval(**var_assignments))
-        return result
+            counts.update(vp.var_name for vp in term.var_powers)
+        return sorted(counts, key=lambda var_name: (-counts[var_name], var_name))
 
     def multiply_by_constant(self, c):
         """
         We rely on the distributive property here.  If you multiply
         a polynomial by a constant, that is just like multiplying each
         of its terms by a constant.
+
+        None of the sigs change, so our terms stay in canonical order.
+        We just need to throw away any terms that become zero.
+        (That can't happen with integers unless c is zero, but it can
+        happen in other rings, such as integers modulo 6.)
         """
         enforce_type(c, Math.value_type)
-        return Poly([term.multiply_by_constant(c) for term in self.terms])
+        if c == Math.one:
+            # take advantage of immutability
+            return self
+        terms = [term.multiply_by_constant(c) for term in self.terms]
+        terms = [term for term in terms if term.coeff != Math.zero]
+        return Poly(terms, simplified=True, ordered=True)
 
     def multiply_with(self, other):
         if type(other) == _Term:
@@ -613,8 +1095,12 @@ class Poly:
     def negated(self):
         """
         This is the additive inverse.
+
+        Negating our terms doesn't change their sigs, so they stay
+        simplified and in canonical order.
         """
-        return Poly([term.negate() for term in self.terms])
+        terms = [term.negate() for term in self.terms]
+        return Poly(terms, simplified=True, ordered=True)
 
     def numpy_vector(self):
         """
@@ -625,11 +1111,7 @@ class Poly:
             raise ValueError("This only works for polynomials over a single variable")
 
         var_name = list(my_var_names)[0]
-        degree_coeffs = {
-            term.degree_of_var(var_name): term.coeff for term in self.terms
-        }
-        max_degree = max(degree_coeffs)
-        return [degree_coeffs.get(degree, 0) for degree in range(1 + max_degree)]
+        return list(self.dense_coefficients(var_name))
 
     def put_terms_in_order(self):
         """
@@ -649,11 +1131,16 @@ class Poly:
         We do this process as soon as we construct any Poly object,
         and it is important that we are deterministic, as it allows
         us to determine if two Poly objects are equivalent.
+
+        Rather than building a list of degrees for each term, we pack
+        each term's degrees into a single integer (see
+        Poly.exponent_field_offsets), so the sort only has to compare
+        ints.
         """
         if len(self.terms) <= 1:
             return
-        sorted_vars = sorted(self.variables())
-        self.terms.sort(key=lambda term: term.sort_key(sorted_vars), reverse=True)
+        offsets = Poly.exponent_field_offsets(Poly.max_exponents(self.terms))
+        self.terms.sort(key=lambda term: term.packed_exponents(offsets), reverse=True)
 
     def raised_to_exponent(self, exponent):
         """
@@ -661,6 +1148,19 @@ class Poly:
 
         We only support the high-school-math notion of exponentation;
         p**4 is just a shorthand for a discrete number of multiplications.
+
+        We don't literally do all those multiplications, though.
+        See Poly.power_by_squaring.
+
+        Since Poly objects are immutable, we also remember our powers,
+        because symbolic manipulations like substitute tend to raise
+        the same polynomial to the same powers over and over again.
+        We key them on Math too, in case somebody calls set_math.
+
+        A single term has a closed form (e.g. (3*x*y)**4 is
+        81*(x**4)*(y**4)), so we skip the multiplications entirely.
+        The new coefficient can still be zero in some rings (e.g.
+        2**2 modulo 4), so we let the constructor simplify.
         """
         enforce_type(exponent, int)
         if exponent < 0:
@@ -670,7 +1170,16 @@ class Poly:
             return Poly.one()
         if exponent == 1:
             return self
-        return self * self.raised_to_exponent(exponent - 1)
+        if len(self.terms) == 1:
+            term = self.terms[0].raised_to_exponent(exponent)
+            return Poly([term], ordered=True)
+
+        if self.powers is None:
+            self.powers = {}
+        key = (Math, exponent)
+        if key not in self.powers:
+            self.powers[key] = Poly.power_by_squaring(self, exponent)
+        return self.powers[key]
 
     def simplify(self):
         """
@@ -694,38 +1203,55 @@ class Poly:
             return
 
         """
-        Put all the "like" terms in the same bucket, then add them.
-
-        And then throw away any zero terms.
+        Very often there is nothing to combine (e.g. x + y + 1), so
+        we first make one cheap pass to see if all the sigs are
+        distinct and all the coefficients are non-zero.
         """
-        buckets = collections.defaultdict(list)
+        sigs = set()
         for term in terms:
-            sig = term.sig
-            buckets[sig].append(term)
-
-        new_terms = []
-        for sub_terms in buckets.values():
-            term = _Term.sum(sub_terms)
-            if term.coeff != Math.zero:
-                new_terms.append(term)
+            if term.coeff == Math.zero or term.sig in sigs:
+                break
+            sigs.add(term.sig)
+        else:
+            return
 
-        self.terms = new_terms
+        self.terms = Poly.combine_like_terms(terms)
 
     def substitute(self, var_name, var_poly):
         """
         assert (2 * x + 1).substitute("x", u + 3) == 2 * u + 7
+
+        Rather than substituting into each term separately (and
+        multiplying by a big power of var_poly for each one), we group
+        the terms by their power of var_name and use Horner's scheme,
+        just like Poly.horner_eval does with values.  For example, with
+        a*(x**3) + b*x + c, we compute
+
+            (a * (var_poly**2) + b) * var_poly + c
+
+        The terms within a group still have distinct sigs once we
+        factor out var_name, so each group is already simplified.
         """
         enforce_type(var_name, str)
         enforce_type(var_poly, Poly)
         if var_name not in self.variables():
             raise ValueError("Unknown variable")
 
-        new_polys = [
-            Poly.poly_based_on_term_with_variable_substitution(term, var_name, var_poly)
-            for term in self.terms
-        ]
-
-        return Poly.sum(new_polys)
+        groups = collections.defaultdict(list)
+        for term in self.terms:
+            smaller_term, exponent = term.factorize_on_var(var_name)
+            groups[exponent].append(smaller_term)
+
+        exponents = sorted(groups, reverse=True)
+        result = Poly.zero()
+        for i, exponent in enumerate(exponents):
+            group = Poly(groups[exponent], simplified=True)
+            result = Poly.add_polys(result, group)
+            next_exponent = exponents[i + 1] if i + 1 < len(exponents) else 0
+            gap = exponent - next_exponent
+            if gap > 0:
+                result = Poly.multiply_polys(result, var_poly.raised_to_exponent(gap))
+        return result
 
     def transform_coefficients(self, f):
         """
@@ -734,16 +1260,26 @@ class Poly:
 
         This can be useful if you are studying things like congruence classes
         of polynomials.
+
+        The sigs don't change, so we only need to throw away any terms
+        whose coefficients become zero; the rest stay in canonical order.
         """
         assert callable(f)
         terms = [t.transform_coefficient(f) for t in self.terms]
-        return Poly(terms)
+        terms = [t for t in terms if t.coeff != Math.zero]
+        return Poly(terms, simplified=True, ordered=True)
 
     def variables(self):
-        vars = set()
-        for term in self.terms:
-            vars |= term.var_names
-        return vars
+        return self.var_names
+
+    @staticmethod
+    def add_dense_coefficients(coeffs1, coeffs2):
+        if len(coeffs1) < len(coeffs2):
+            coeffs1, coeffs2 = coeffs2, coeffs1
+        result = list(coeffs1)
+        for i, c in enumerate(coeffs2):
+            result[i] = Math.add(result[i], c)
+        return result
 
     @staticmethod
     def add_polys(poly1, poly2):
@@ -759,15 +1295,363 @@ class Poly:
             return poly1
         return Poly(poly1.terms + poly2.terms)
 
+    @staticmethod
+    def build_horner_tree(terms, var_names):
+        """
+        Suppose we have 4*(x**3)*y + 2*(x**3) + 5*x*y + 7, and
+        var_names is ["x", "y"].  We group the terms by their powers
+        of x, from highest to lowest, and then group each of those
+        groups by their powers of y:
+
+            ("x", [
+                (("y", [(4*(x**3)*y, 1), (2*(x**3), 0)]), 2),
+                (("y", [(5*x*y, 1)]), 1),
+                (("y", [(7, 0)]), 0),
+            ])
+
+        Each branch pairs an inner tree with the gap down to the next
+        power of the variable, which is what Horner's scheme multiplies
+        by after adding in that inner tree.
+
+        Once we have grouped on every variable, each group has exactly
+        one term left (since our terms are simplified), and that term
+        serves as the leaf.  We only ever read the coefficient from the
+        leaf, so the tree doesn't depend on the current Math handler.
+        """
+        if len(var_names) == 0:
+            (term,) = terms
+            return term
+
+        var_name = var_names[0]
+        other_var_names = var_names[1:]
+
+        groups = collections.defaultdict(list)
+        for term in terms:
+            groups[term.degree_of_var(var_name)].append(term)
+
+        exponents = sorted(groups, reverse=True)
+        branches = []
+        for i, exponent in enumerate(exponents):
+            inner = Poly.build_horner_tree(groups[exponent], other_var_names)
+            next_exponent = exponents[i + 1] if i + 1 < len(exponents) else 0
+            branches.append((inner, exponent - next_exponent))
+        return (var_name, branches)
+
+    @staticmethod
+    def combine_like_terms(terms):
+        """
+        Put all the "like" terms in the same bucket, adding up their
+        coefficients as we go, and then throw away any zero terms.
+
+        We don't build a list per bucket, and we only build a new term
+        for a sig whose coefficient actually changed; otherwise we
+        reuse the original term.
+        """
+        add = Math.add
+        coeffs = {}
+        terms_by_sig = {}
+        for term in terms:
+            sig = term.sig
+            if sig in coeffs:
+                coeffs[sig] = add(coeffs[sig], term.coeff)
+            else:
+                coeffs[sig] = term.coeff
+                terms_by_sig[sig] = term
+
+        new_terms = []
+        for sig, coeff in coeffs.items():
+            if coeff == Math.zero:
+                continue
+            term = terms_by_sig[sig]
+            new_terms.append(term if term.coeff is coeff else term.with_coeff(coeff))
+        return new_terms
+
     @staticmethod
     def constant(c):
         enforce_type(c, Math.value_type)
         return Poly([_Term.constant(c)])
 
+    @staticmethod
+    def dense_estrin_eval(coeffs, x):
+        """
+        This is Estrin's scheme.  For [a0, a1, a2, a3] we compute
+
+            (a0 + a1*x) + (a2 + a3*x) * (x**2)
+
+        In general, we pair up neighboring coefficients, square x, and
+        repeat until only one value is left.
+
+        It does about as many multiplications as Horner's scheme, but
+        they are balanced: Horner keeps multiplying a huge running
+        result by a small x, whereas here the big values get
+        multiplied by each other, and Python's big-int multiplication
+        (Karatsuba for large numbers) is much faster on balanced
+        operands.
+        """
+        add = Math.add
+        mul = Math.mul
+        values = list(coeffs)
+        while len(values) > 1:
+            if len(values) % 2 == 1:
+                values.append(Math.zero)
+            values = [
+                add(values[i], mul(values[i + 1], x))
+                for i in range(0, len(values), 2)
+            ]
+            if len(values) > 1:
+                x = mul(x, x)
+        return values[0] if values else Math.zero
+
+    @staticmethod
+    def dense_eval(coeffs, x):
+        """
+        Evaluate dense_coefficients at x, using whichever of
+        Poly.dense_horner_eval or Poly.dense_estrin_eval is faster
+        for this many coefficients.
+        """
+        if len(coeffs) >= ESTRIN_CUTOFF:
+            return Poly.dense_estrin_eval(coeffs, x)
+        return Poly.dense_horner_eval(coeffs, x)
+
+    @staticmethod
+    def dense_horner_eval(coeffs, x):
+        """
+        This evaluates a polynomial given its dense_coefficients,
+        using the classic Horner loop.  For [1, 0, 3] (i.e. 3*(x**2)+1)
+        we compute ((3 * x) + 0) * x + 1.
+        """
+        add = Math.add
+        mul = Math.mul
+        result = Math.zero
+        for coeff in reversed(coeffs):
+            result = add(mul(result, x), coeff)
+        return result
+
+    @staticmethod
+    def exponent_field_offsets(max_exponents):
+        """
+        This lets us pack a term's exponents into a single integer
+        (see _Term.packed_exponents), by giving each variable its own
+        field of bits that is wide enough for its biggest power.  For
+        example, {"x": 3, "y": 1} gives us {"x": 1, "y": 0}, and
+        (x**2)*y packs to (2 << 1) + 1.
+
+        The first var name gets the most significant bits, so comparing
+        two packed integers gives the same answer as comparing the two
+        terms' lists of degrees in the order of Poly.put_terms_in_order.
+
+        Python integers never overflow, so this works no matter how
+        many variables we have.
+        """
+        offsets = {}
+        offset = 0
+        for var_name in sorted(max_exponents, reverse=True):
+            offsets[var_name] = offset
+            offset += max_exponents[var_name].bit_length()
+        return offsets
+
+    @staticmethod
+    def from_dense_coefficients(var_name, coeffs, validate=True):
+        """
+        This is the inverse of dense_coefficients:
+
+            Poly.from_dense_coefficients("x", [1, 0, 3]) == 3*(x**2)+1
+
+        As with _Term, our own methods pass in validate=False when
+        the coefficients come straight out of our own arithmetic.
+
+        We walk from the highest degree down, so the terms come out
+        in canonical order and we don't need to sort them.
+        """
+        if validate:
+            enforce_type(var_name, str)
+            enforce_legal_variable_name(var_name)
+            enforce_list_element_types(coeffs, Math.value_type)
+
+        terms = []
+        for degree in range(len(coeffs) - 1, -1, -1):
+            coeff = coeffs[degree]
+            if coeff == Math.zero:
+                continue
+            if degree == 0:
+                terms.append(_Term(coeff, [], validate=False))
+            else:
+                var_power = _VarPower.get(var_name, degree)
+                terms.append(_Term(coeff, [var_power], validate=False))
+        return Poly(terms, simplified=True, ordered=True)
+
+    @staticmethod
+    def horner_eval(node, var_assignments, powers):
+        """
+        This evaluates a tree from Poly.build_horner_tree.  For the
+        example there, we compute
+
+            ((4*y + 2) * (x**2) + 5*y) * x + 7
+
+        The same gaps between powers (e.g. x**2 above) tend to come
+        up over and over again in the inner groups, so the caller
+        passes in a powers dict that caches x**gap for the duration
+        of a single evaluation.
+        """
+        if type(node) == _Term:
+            return node.coeff
+
+        var_name, branches = node
+        x = var_assignments[var_name]
+        result = Math.zero
+        for inner, gap in branches:
+            result = Math.add(
+                result, Poly.horner_eval(inner, var_assignments, powers)
+            )
+            if gap > 0:
+                key = (var_name, gap)
+                if key not in powers:
+                    powers[key] = x if gap == 1 else Math.power(x, gap)
+                result = Math.mul(result, powers[key])
+        return result
+
+    @staticmethod
+    def karatsuba(coeffs1, coeffs2):
+        """
+        This is Karatsuba's trick for multiplying dense coefficient
+        lists.  We split each list in half, so that (with X = x**m)
+
+            a = a_lo + a_hi * X
+            b = b_lo + b_hi * X
+
+        and then a * b is z0 + z1 * X + z2 * (X**2), where
+
+            z0 = a_lo * b_lo
+            z2 = a_hi * b_hi
+            z1 = (a_lo + a_hi) * (b_lo + b_hi) - z0 - z2
+
+        That is three half-sized multiplications instead of four.
+        We only need addition, multiplication, and negation from Math,
+        so this works in any commutative ring.
+        """
+        n1 = len(coeffs1)
+        n2 = len(coeffs2)
+        if min(n1, n2) < KARATSUBA_CUTOFF:
+            return Poly.schoolbook(coeffs1, coeffs2)
+
+        m = max(n1, n2) // 2
+        a_lo, a_hi = coeffs1[:m], coeffs1[m:]
+        b_lo, b_hi = coeffs2[:m], coeffs2[m:]
+
+        result = [Math.zero] * (n1 + n2 - 1)
+
+        def add_into(coeffs, offset, negate=False):
+            for i, c in enumerate(coeffs):
+                if negate:
+                    c = Math.negate(c)
+                result[offset + i] = Math.add(result[offset + i], c)
+
+        if len(a_hi) == 0 or len(b_hi) == 0:
+            # One list is much shorter than the other, so we just
+            # multiply it with each half of the longer one.
+            if len(a_hi) == 0:
+                a_lo, a_hi, b_lo, b_hi = b_lo, b_hi, a_lo, a_hi
+            add_into(Poly.karatsuba(a_lo, b_lo), 0)
+            add_into(Poly.karatsuba(a_hi, b_lo), m)
+            return result
+
+        z0 = Poly.karatsuba(a_lo, b_lo)
+        z2 = Poly.karatsuba(a_hi, b_hi)
+        z1 = Poly.karatsuba(
+            Poly.add_dense_coefficients(a_lo, a_hi),
+            Poly.add_dense_coefficients(b_lo, b_hi),
+        )
+
+        add_into(z0, 0)
+        add_into(z1, m)
+        add_into(z0, m, negate=True)
+        add_into(z2, m, negate=True)
+        add_into(z2, 2 * m)
+        return result
+
+    @staticmethod
+    def kronecker(coeffs1, coeffs2):
+        """
+        This is Kronecker substitution.  If we evaluate both
+        polynomials at x = 2**k, for a k big enough that no coefficient
+        of the product can spill into its neighbors, then one big
+        integer multiplication computes the whole product, and we can
+        read off the product's coefficients k bits at a time.
+
+        Python multiplies big integers in C (using Karatsuba itself),
+        which is much faster than any coefficient loop we could write
+        here.  This only makes sense for plain integers, of course.
+
+        Coefficients can be negative, so we reserve a sign bit, and we
+        shift every slot up by half of 2**k (and then correct for it),
+        so that every slot is non-negative and we can work directly
+        with bytes rather than shifting big integers around.
+        """
+        n1 = len(coeffs1)
+        n2 = len(coeffs2)
+        bound = max(abs(c) for c in coeffs1) * max(abs(c) for c in coeffs2)
+        bound *= min(n1, n2)
+        num_bytes = (bound.bit_length() + 1) // 8 + 1
+        half = 1 << (8 * num_bytes - 1)
+
+        def bias(n):
+            return int.from_bytes(half.to_bytes(num_bytes, "little") * n, "little")
+
+        def pack(coeffs):
+            data = b"".join((c + half).to_bytes(num_bytes, "little") for c in coeffs)
+            return int.from_bytes(data, "little") - bias(len(coeffs))
+
+        n = n1 + n2 - 1
+        product = pack(coeffs1) * pack(coeffs2) + bias(n)
+        data = product.to_bytes(n * num_bytes, "little")
+        return [
+            int.from_bytes(data[i : i + num_bytes], "little") - half
+            for i in range(0, n * num_bytes, num_bytes)
+        ]
+
+    @staticmethod
+    def max_exponents(terms):
+        """
+        This maps each var name to its biggest power among the terms.
+        """
+        biggest = {}
+        for term in terms:
+            for vp in term.var_powers:
+                if vp.exponent > biggest.get(vp.var_name, 0):
+                    biggest[vp.var_name] = vp.exponent
+        return biggest
+
+    @staticmethod
+    def multiply_dense_coefficients(coeffs1, coeffs2):
+        """
+        This multiplies two polynomials in the same single variable,
+        using their dense_coefficients lists.  (In other words, it
+        computes the convolution of the two lists.)
+
+        For integers we let Python's own big-int multiplication do the
+        work (see Poly.kronecker).  Otherwise, for long lists we use
+        Poly.karatsuba.
+        """
+        if len(coeffs1) == 0 or len(coeffs2) == 0:
+            return []
+        if Math is integer_math.IntegerMath:
+            if min(len(coeffs1), len(coeffs2)) >= KRONECKER_CUTOFF:
+                return Poly.kronecker(coeffs1, coeffs2)
+        return Poly.karatsuba(coeffs1, coeffs2)
+
     @staticmethod
     def multiply_polys(poly1, poly2):
         """
-        We mostly rely on Poly.__init__ to do the heavy lifting here.
+        Rather than building all len(poly1.terms) * len(poly2.terms)
+        products and then having Poly.simplify put them into buckets,
+        we combine like terms as we go.  Then we can tell Poly.__init__
+        that our terms are already simplified.
+
+        See Poly.sum_of_products for how we do that.
+
+        If both polynomials are dense in the same single variable,
+        we skip the _Term objects altogether and multiply their
+        coefficient lists.
         """
         enforce_type(poly1, Poly)
         enforce_type(poly2, Poly)
@@ -781,29 +1665,57 @@ class Poly:
         if poly2.is_one():
             return poly1
 
-        terms = [
-            _Term.multiply_terms(t1, t2) for t1 in poly1.terms for t2 in poly2.terms
-        ]
-        return Poly(terms)
+        var_names = poly1.variables() | poly2.variables()
+        if len(var_names) == 1:
+            (var_name,) = var_names
+            if poly1.is_dense(var_name) and poly2.is_dense(var_name):
+                coeffs = Poly.multiply_dense_coefficients(
+                    poly1.dense_coefficients(var_name),
+                    poly2.dense_coefficients(var_name),
+                )
+                return Poly.from_dense_coefficients(var_name, coeffs, validate=False)
+
+        return Poly.sum_of_products([(poly1, poly2)])
 
     @staticmethod
     def one():
         return Poly.constant(Math.one)
 
     @staticmethod
-    def poly_based_on_term_with_variable_substitution(term, var_name, var_poly):
-        enforce_type(term, _Term)
-        enforce_type(var_name, str)
-        enforce_type(var_poly, Poly)
+    def power_by_squaring(poly, exponent):
+        """
+        We use the standard square-and-multiply approach, so that p**8
+        is computed as ((p*p)**2)**2, which only takes log2(exponent)
+        squarings.
+        """
+        result = Poly.one()
+        base = poly
+        while True:
+            if exponent & 1:
+                result = result * base
+            exponent >>= 1
+            if exponent == 0:
+                return result
+            base = base * base
 
-        smaller_term, exponent = term.factorize_on_var(var_name)
-        small_poly = Poly([smaller_term])
-        if exponent == 0:
-            return small_poly
-        else:
-            return Poly.multiply_polys(
-                small_poly, var_poly.raised_to_exponent(exponent)
-            )
+    @staticmethod
+    def schoolbook(coeffs1, coeffs2):
+        """
+        This is the grade-school convolution of two non-empty dense
+        coefficient lists.
+        """
+        # We look these up once, since the inner loop is hot.
+        add = Math.add
+        mul = Math.mul
+        zero = Math.zero
+
+        result = [zero] * (len(coeffs1) + len(coeffs2) - 1)
+        for i, c1 in enumerate(coeffs1):
+            if c1 == zero:
+                continue
+            for j, c2 in enumerate(coeffs2):
+                result[i + j] = add(result[i + j], mul(c1, c2))
+        return result
 
     @staticmethod
     def subtract_polys(poly1, poly2):
@@ -819,6 +1731,8 @@ class Poly:
         You can use ordinary Python sum() on a list of polynomials,
         but this should be faster, since it avoids creating a bunch
         of intermediate partial polynomial sums for large lists.
+
+        We combine like terms across all the inputs in one pass.
         """
         enforce_list_element_types(poly_list, Poly)
 
@@ -831,7 +1745,63 @@ class Poly:
         terms = []
         for p in poly_list:
             terms.extend(p.terms)
-        return Poly(terms)
+        return Poly(Poly.combine_like_terms(terms), simplified=True)
+
+    @staticmethod
+    def sum_of_products(pairs):
+        """
+        This computes the sum of poly1 * poly2 for each (poly1, poly2)
+        in pairs, e.g. a*b + c*d, combining like terms across all of
+        the products at once, so we only simplify and sort once.
+
+        We don't even build a _Term for each product of two terms.
+        Instead, we pack each term's exponents into a single integer
+        (see Poly.exponent_field_offsets), so that multiplying the
+        variable parts of two terms is just adding two integers.  We
+        only build one _Term per distinct key at the very end.
+
+        The fields are wide enough for any product, so the keys also
+        tell us the canonical order of the result.  Sorting the keys is
+        cheaper than having Poly.put_terms_in_order sort the terms.
+        """
+        max_exponents = {}
+        for poly1, poly2 in pairs:
+            enforce_type(poly1, Poly)
+            enforce_type(poly2, Poly)
+            product_max_exponents = collections.Counter()
+            product_max_exponents.update(Poly.max_exponents(poly1.terms))
+            product_max_exponents.update(Poly.max_exponents(poly2.terms))
+            for var_name, exponent in product_max_exponents.items():
+                if exponent > max_exponents.get(var_name, 0):
+                    max_exponents[var_name] = exponent
+        offsets = Poly.exponent_field_offsets(max_exponents)
+
+        add = Math.add
+        mul = Math.mul
+        coeffs = {}
+        factors = {}
+        for poly1, poly2 in pairs:
+            pairs2 = [(t2.packed_exponents(offsets), t2) for t2 in poly2.terms]
+            for t1 in poly1.terms:
+                key1 = t1.packed_exponents(offsets)
+                coeff1 = t1.coeff
+                for key2, t2 in pairs2:
+                    key = key1 + key2
+                    coeff = mul(coeff1, t2.coeff)
+                    if key in coeffs:
+                        coeffs[key] = add(coeffs[key], coeff)
+                    else:
+                        coeffs[key] = coeff
+                        factors[key] = (t1, t2)
+
+        terms = []
+        for key in sorted(coeffs, reverse=True):
+            coeff = coeffs[key]
+            if coeff == Math.zero:
+                continue
+            t1, t2 = factors[key]
+            terms.append(_Term.multiply_terms(t1, t2).with_coeff(coeff))
+        return Poly(terms, simplified=True, ordered=True)
 
     @staticmethod
     def var(label):
@@ -848,7 +1818,7 @@ class Poly:
         enforce_type(label, str)
         coeff = Math.one
         exponent = 1  # exponents are ALWAYS integers
-        var_power = _VarPower(label, exponent)
+        var_power = _VarPower.get(label, exponent)
         term = _Term(coeff, [var_power])
         return Poly([term])
 